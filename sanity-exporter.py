@@ -14,14 +14,57 @@ import codecs
 import time
 import platform
 import html
+import re
+import fnmatch
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Constants
 TEXT_EXTENSIONS = [
     '.txt', '.py', '.js', '.java', '.kt', '.xml', '.gradle', 
     '.json', '.md', '.html', '.css', '.csv', '.ts', '.jsx', 
     '.tsx', '.yml', '.yaml', '.properties', '.c', '.cpp', '.h', 
-    '.hpp', '.php', '.rb', '.go', '.swift', '.kt', '.kts'
+    '.hpp', '.php', '.rb', '.go', '.swift', '.kts'
 ]
+_TEXT_EXT_SET = frozenset(ext.lower() for ext in TEXT_EXTENSIONS)
+OUTPUT_BUFFER_SIZE = 1 << 20  # 1 MiB write buffer for export files
+ENCODING_SAMPLE_SIZE = 4096  # bytes passed to chardet when UTF-8 decoding fails
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+_O_NOATIME = getattr(os, "O_NOATIME", 0)  # Linux only
+
+HTML_HEADER = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Project Export: {title}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 20px; }}
+        h1, h2 {{ color: #2c3e50; }}
+        .structure {{ background-color: #f9f9f9; padding: 15px; border-radius: 5px; }}
+        .file-content {{ margin-top: 20px; border-left: 3px solid #3498db; padding-left: 15px; }}
+        .file-header {{ font-weight: bold; color: #2980b9; }}
+        .content {{ white-space: pre-wrap; font-family: monospace; }}
+        .tree {{ font-family: monospace; }}
+    </style>
+</head>
+<body>
+    <h1>Project Export: {heading}</h1>
+    <p>Exported at: {exported_at}</p>
+"""
+
+# Faster JSON encoding when orjson is available
+try:
+    import orjson
+    
+    def _json_dumps(data):
+        """Serialize data to indented UTF-8 JSON bytes"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_dumps(data):
+        """Serialize data to indented UTF-8 JSON bytes"""
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
 
 # For colored output in Windows
 try:
@@ -103,6 +146,7 @@ def validate_directory(path):
     """Validate directory existence"""
     return os.path.exists(path) and os.path.isdir(path)
 
+@lru_cache(maxsize=None)
 def is_supported_encoding(encoding):
     """Check if encoding is supported"""
     try:
@@ -111,299 +155,375 @@ def is_supported_encoding(encoding):
     except LookupError:
         return False
 
-def is_text_file(file_path):
-    """Identify text files by extension"""
-    return any(file_path.lower().endswith(ext) for ext in TEXT_EXTENSIONS)
+def is_text_file(file_name):
+    """Identify text files by extension (expects a base name)"""
+    dot = file_name.rfind('.')
+    return dot != -1 and file_name[dot:].lower() in _TEXT_EXT_SET
+
+def _read_file_bytes(file_path):
+    """Read a whole file as bytes without updating its access time where supported"""
+    try:
+        fd = os.open(file_path, _READ_FLAGS | _O_NOATIME)
+    except PermissionError:
+        # O_NOATIME is only allowed on files we own
+        if not _O_NOATIME:
+            raise
+        fd = os.open(file_path, _READ_FLAGS)
+    with open(fd, 'rb') as f:
+        return f.read()
+
+def _decode_file_bytes(raw_data):
+    """Decode file bytes: BOM, then UTF-8, then chardet on a sample"""
+    # Byte order marks (UTF-32 first: its LE mark starts with UTF-16 LE's)
+    if raw_data[:3] == b'\xef\xbb\xbf':
+        text = raw_data.decode('utf-8-sig', errors='replace')
+    elif raw_data[:4] in (b'\xff\xfe\x00\x00', b'\x00\x00\xfe\xff'):
+        text = raw_data.decode('utf-32', errors='replace')
+    elif raw_data[:2] in (b'\xff\xfe', b'\xfe\xff'):
+        text = raw_data.decode('utf-16', errors='replace')
+    else:
+        try:
+            # Fast path: most source files are plain UTF-8/ASCII
+            text = raw_data.decode('utf-8')
+        except UnicodeDecodeError:
+            # Fall back to encoding detection on a sample
+            encoding = chardet.detect(raw_data[:ENCODING_SAMPLE_SIZE])['encoding'] or 'latin-1'
+            if not is_supported_encoding(encoding):
+                encoding = 'latin-1'
+            text = raw_data.decode(encoding, errors='replace')
+    
+    # Universal newlines, as text-mode reads did
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 def safe_read_file(file_path):
     """Universal file reading with encoding handling"""
     try:
-        # Detect encoding
-        with open(file_path, 'rb') as f:
-            raw_data = f.read(4096)
-            result = chardet.detect(raw_data)
-            encoding = result['encoding'] or 'utf-8'
+        return _decode_file_bytes(_read_file_bytes(file_path))
+    except Exception as e:
+        logging.error(f"Error reading file {file_path}: {e}")
+        return f"\n[FILE READ ERROR: {str(e)}]\n"
+
+def safe_read_file_bytes(file_path):
+    """File reading that returns UTF-8 bytes, passing UTF-8 files through untouched"""
+    try:
+        raw_data = _read_file_bytes(file_path)
         
-        # Validate encoding
-        if not is_supported_encoding(encoding):
-            encoding = 'utf-8'
+        # UTF-8 (with or without BOM) needs no transcoding
+        body = raw_data[3:] if raw_data[:3] == b'\xef\xbb\xbf' else raw_data
+        try:
+            body.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        else:
+            # Universal newlines, matching safe_read_file
+            if b'\r' in body:
+                body = body.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            return body
         
-        # Read file
-        with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-            return f.read()
+        return _decode_file_bytes(raw_data).encode('utf-8')
     except Exception as e:
         logging.error(f"Error reading file {file_path}: {e}")
-        return f"\n[FILE READ ERROR: {str(e)}]\n"
+        return f"\n[FILE READ ERROR: {str(e)}]\n".encode('utf-8')
+
+def _read_files(file_paths, reader=safe_read_file):
+    """
+    Read files on a thread pool, yielding contents in input order
+    :param file_paths: list of paths
+    :param reader: function(path) used to read each file
+    """
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Bounded read-ahead keeps memory proportional to the window
+        paths = iter(file_paths)
+        pending = deque(executor.submit(reader, path)
+                        for _, path in zip(range(max_workers * 2), paths))
+        while pending:
+            content = pending.popleft().result()
+            path = next(paths, None)
+            if path is not None:
+                pending.append(executor.submit(reader, path))
+            yield content
+
+def _compile_name_filter(names):
+    """
+    Build a matcher for file names given as literals or glob patterns
+    :return: function(name) -> bool
+    """
+    # Every entry still matches literally (e.g. "file[1].txt")
+    literals = frozenset(names)
+    patterns = [n for n in names if any(c in n for c in "*?[")]
+    if not patterns:
+        return literals.__contains__
+    
+    # One alternation regex instead of an fnmatch call per pattern
+    pattern_match = re.compile("|".join(fnmatch.translate(p) for p in patterns)).match
+    return lambda name: name in literals or pattern_match(name) is not None
+
+def _iter_tree(root, exclude_dirs, exclude_files):
+    """
+    Walk a directory tree top-down with os.scandir
+    :return: generator of tuples (path, depth, dirs, files) with DirEntry lists
+    """
+    # Hash lookups (plus one regex for glob patterns) per entry
+    exclude_dirs = frozenset(exclude_dirs)
+    is_excluded_file = _compile_name_filter(exclude_files)
+    
+    stack = [(root, 0)]
+    while stack:
+        path, depth = stack.pop()
+        dirs = []
+        files = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if entry.name not in exclude_dirs:
+                            dirs.append(entry)
+                    elif not is_excluded_file(entry.name):
+                        files.append(entry)
+        except OSError:
+            continue
+        
+        # Inode order approximates on-disk order and cuts seeks on HDDs
+        # (inode() is free on POSIX but costs a stat() per entry on Windows)
+        if os.name != "nt":
+            dirs.sort(key=os.DirEntry.inode)
+            files.sort(key=os.DirEntry.inode)
+        
+        yield path, depth, dirs, files
+        
+        # Descend in sorted order, without following directory symlinks
+        stack.extend((d.path, depth + 1) for d in reversed(dirs) if not d.is_symlink())
 
 def export_to_txt(project_dir, exclude_dirs, exclude_files, output_file, mode, progress_callback):
     """Export project to TXT format"""
-    # Count files for progress bar
-    total_files = 0
-    if mode in ["both", "content"]:
-        for root, dirs, files in os.walk(project_dir):
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            total_files += sum(
-                1 for file in files 
-                if file not in exclude_files 
-                and is_text_file(os.path.join(root, file)))
+    export_structure = mode in ["both", "structure"]
+    export_content = mode in ["both", "content"]
+    # Traversal paths all start with this prefix; slicing replaces os.path.relpath
+    prefix_len = len(os.path.join(project_dir, ''))
     
+    text_files = []
     processed_files = 0
-    with open(output_file, "w", encoding="utf-8") as out_file:
-        # Export structure
-        if mode in ["both", "structure"]:
+    progress = 0
+    # Binary output: UTF-8 file contents are copied through as bytes
+    with open(output_file, "wb", buffering=OUTPUT_BUFFER_SIZE) as out_file:
+        if export_structure:
             if progress_callback:
                 progress_callback(0, "Building structure...")
             
             # Add spacing before section
-            out_file.write("\n\n===== PROJECT STRUCTURE =====\n\n")
+            out_file.write(b"\n\n===== PROJECT STRUCTURE =====\n\n")
+        
+        # Single pass: tree generation and text file collection
+        for root, level, dirs, files in _iter_tree(project_dir, exclude_dirs, exclude_files):
+            if export_content:
+                text_files.extend(entry.path for entry in files if is_text_file(entry.name))
             
-            # Tree generation
-            for root, dirs, files in os.walk(project_dir):
-                # Apply exclusions
-                dirs[:] = [d for d in dirs if d not in exclude_dirs]
-                files = [f for f in files if f not in exclude_files]
-                
-                # Calculate tree depth
-                level = root.replace(project_dir, '').count(os.sep)
-                indent = '│   ' * (level - 1) + '├── ' if level > 0 else ''
-                
-                # Write directory
-                out_file.write(f"{indent}{os.path.basename(root)}/\n")
-                
-                # Write files
-                file_indent = '│   ' * level + '├── '
-                last_file_indent = '│   ' * level + '└── '
-                for i, f in enumerate(files):
-                    prefix = last_file_indent if i == len(files) - 1 else file_indent
-                    out_file.write(f"{prefix}{f}\n")
+            if not export_structure:
+                continue
+            
+            indent = '│   ' * (level - 1) + '├── ' if level > 0 else ''
+            
+            # Directory line
+            lines = [f"{indent}{os.path.basename(root)}/\n"]
             
+            # File lines
+            file_indent = '│   ' * level + '├── '
+            last_file_indent = '│   ' * level + '└── '
+            for i, f in enumerate(files):
+                prefix = last_file_indent if i == len(files) - 1 else file_indent
+                lines.append(f"{prefix}{f.name}\n")
+            out_file.write(''.join(lines).encode("utf-8"))
+        
+        if export_structure:
             # Add spacing after section
-            out_file.write("\n\n")
-
+            out_file.write(b"\n\n")
+        
+        total_files = len(text_files)
+        
         # Export content
-        if mode in ["both", "content"]:
+        if export_content:
             # Add spacing before section
-            out_file.write("\n\n===== FILE CONTENTS =====\n\n")
+            out_file.write(b"\n\n===== FILE CONTENTS =====\n\n")
             
-            for root, dirs, files in os.walk(project_dir):
-                # Apply exclusions
-                dirs[:] = [d for d in dirs if d not in exclude_dirs]
-                files = [f for f in files if f not in exclude_files]
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if not is_text_file(file_path):
-                        continue
+            contents = _read_files(text_files, reader=safe_read_file_bytes)
+            for file_path, content in zip(text_files, contents):
+                try:
+                    # Write content with spacing in a single call
+                    out_file.write(b''.join([
+                        b"\n~~~~~ ",
+                        file_path[prefix_len:].encode("utf-8"),
+                        b" ~~~~~~\n\n",
+                        content,
+                        b"\n\n"
+                    ]))
                     
-                    try:
-                        # Read and write content with spacing
-                        content = safe_read_file(file_path)
-                        out_file.write(f"\n~~~~~ {os.path.relpath(file_path, project_dir)} ~~~~~~\n\n")
-                        out_file.write(content)
-                        out_file.write("\n\n")
-                        
-                        # Update progress
-                        processed_files += 1
-                        if progress_callback and total_files > 0:
-                            progress = int((processed_files / total_files) * 100)
-                            progress_callback(progress, f"Processed: {processed_files}/{total_files}")
-                    except Exception as e:
-                        logging.error(f"Error processing file {file_path}: {e}")
-                        if progress_callback:
-                            progress_callback(progress, f"Error in file: {file_path}")
+                    # Update progress (redraw only when the percentage changes)
+                    processed_files += 1
+                    new_progress = processed_files * 100 // total_files
+                    if progress_callback and new_progress != progress:
+                        progress = new_progress
+                        progress_callback(progress, f"Processed: {processed_files}/{total_files}")
+                except Exception as e:
+                    logging.error(f"Error processing file {file_path}: {e}")
+                    if progress_callback:
+                        progress_callback(progress, f"Error in file: {file_path}")
     
     return True, ""
 
 def export_to_json(project_dir, exclude_dirs, exclude_files, output_file, mode, progress_callback):
     """Export project to JSON format"""
-    project_data = {
-        "structure": {},
-        "content": {}
-    }
+    export_structure = mode in ["both", "structure"]
+    export_content = mode in ["both", "content"]
     
-    # Count files for progress bar
-    total_files = 0
-    if mode in ["both", "content"]:
-        for root, dirs, files in os.walk(project_dir):
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            total_files += sum(
-                1 for file in files 
-                if file not in exclude_files 
-                and is_text_file(os.path.join(root, file)))
+    # Structure-only exports carry no "content" section
+    project_data = {"structure": {}}
+    if export_content:
+        project_data["content"] = {}
     
-    processed_files = 0
+    # Traversal paths all start with this prefix; slicing replaces os.path.relpath
+    prefix_len = len(os.path.join(project_dir, ''))
+    
+    if export_structure and progress_callback:
+        progress_callback(0, "Building structure...")
     
-    # Export structure
-    if mode in ["both", "structure"]:
-        if progress_callback:
-            progress_callback(0, "Building structure...")
+    # Single pass: structure and text file collection
+    text_files = []
+    for root, level, dirs, files in _iter_tree(project_dir, exclude_dirs, exclude_files):
+        if export_content:
+            text_files.extend(entry.path for entry in files if is_text_file(entry.name))
         
-        for root, dirs, files in os.walk(project_dir):
-            # Apply exclusions
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            files = [f for f in files if f not in exclude_files]
-            
-            rel_path = os.path.relpath(root, project_dir)
-            if rel_path == ".":
-                rel_path = ""
-            
-            # Create directory entry
-            if rel_path not in project_data["structure"]:
-                project_data["structure"][rel_path] = {
-                    "directories": [],
-                    "files": []
-                }
-            
-            # Add subdirectories and files
-            project_data["structure"][rel_path]["directories"] = dirs
-            project_data["structure"][rel_path]["files"] = files
+        if not export_structure:
+            continue
+        
+        # Directory entry with its subdirectories and files
+        project_data["structure"][root[prefix_len:]] = {
+            "directories": [d.name for d in dirs],
+            "files": [f.name for f in files]
+        }
+    
+    total_files = len(text_files)
+    processed_files = 0
+    progress = 0
     
     # Export content
-    if mode in ["both", "content"]:
-        for root, dirs, files in os.walk(project_dir):
-            # Apply exclusions
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            files = [f for f in files if f not in exclude_files]
-            
-            for file in files:
-                file_path = os.path.join(root, file)
-                if not is_text_file(file_path):
-                    continue
+    if export_content:
+        for file_path, content in zip(text_files, _read_files(text_files)):
+            try:
+                # Store file content
+                rel_path = file_path[prefix_len:]
+                project_data["content"][rel_path] = content
                 
-                try:
-                    # Read file content
-                    content = safe_read_file(file_path)
-                    rel_path = os.path.relpath(file_path, project_dir)
-                    project_data["content"][rel_path] = content
-                    
-                    # Update progress
-                    processed_files += 1
-                    if progress_callback and total_files > 0:
-                        progress = int((processed_files / total_files) * 100)
-                        progress_callback(progress, f"Processed: {processed_files}/{total_files}")
-                except Exception as e:
-                    logging.error(f"Error processing file {file_path}: {e}")
-                    if progress_callback:
-                        progress_callback(progress, f"Error in file: {file_path}")
+                # Update progress (redraw only when the percentage changes)
+                processed_files += 1
+                new_progress = processed_files * 100 // total_files
+                if progress_callback and new_progress != progress:
+                    progress = new_progress
+                    progress_callback(progress, f"Processed: {processed_files}/{total_files}")
+            except Exception as e:
+                logging.error(f"Error processing file {file_path}: {e}")
+                if progress_callback:
+                    progress_callback(progress, f"Error in file: {file_path}")
     
     # Write JSON output
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(project_data, f, indent=2, ensure_ascii=False)
+        with open(output_file, "wb", buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write(_json_dumps(project_data))
         return True, ""
     except Exception as e:
         return False, str(e)
 
 def export_to_html(project_dir, exclude_dirs, exclude_files, output_file, mode, progress_callback):
     """Export project to HTML format"""
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Project Export: {os.path.basename(project_dir)}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 20px; }}
-        h1, h2 {{ color: #2c3e50; }}
-        .structure {{ background-color: #f9f9f9; padding: 15px; border-radius: 5px; }}
-        .file-content {{ margin-top: 20px; border-left: 3px solid #3498db; padding-left: 15px; }}
-        .file-header {{ font-weight: bold; color: #2980b9; }}
-        .content {{ white-space: pre-wrap; font-family: monospace; }}
-        .tree {{ font-family: monospace; }}
-    </style>
-</head>
-<body>
-    <h1>Project Export: {html.escape(os.path.basename(project_dir))}</h1>
-    <p>Exported at: {time.strftime('%Y-%m-%d %H:%M:%S')}</p>
-"""
+    export_structure = mode in ["both", "structure"]
+    export_content = mode in ["both", "content"]
+    # Traversal paths all start with this prefix; slicing replaces os.path.relpath
+    prefix_len = len(os.path.join(project_dir, ''))
+    project_name = os.path.basename(project_dir)
+    escape = html.escape
     
-    # Count files for progress bar
-    total_files = 0
-    if mode in ["both", "content"]:
-        for root, dirs, files in os.walk(project_dir):
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            total_files += sum(
-                1 for file in files 
-                if file not in exclude_files 
-                and is_text_file(os.path.join(root, file)))
-    
-    processed_files = 0
-    
-    # Export structure
-    if mode in ["both", "structure"]:
-        if progress_callback:
-            progress_callback(0, "Building structure...")
-        
-        html_content += "<h2>Project Structure</h2>\n"
-        html_content += "<div class='structure'>\n"
-        html_content += "<div class='tree'>\n"
-        
-        for root, dirs, files in os.walk(project_dir):
-            # Apply exclusions
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            files = [f for f in files if f not in exclude_files]
+    try:
+        with open(output_file, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as out:
+            out.write(HTML_HEADER.format(
+                title=project_name,
+                heading=html.escape(project_name),
+                exported_at=time.strftime('%Y-%m-%d %H:%M:%S')
+            ))
             
-            # Calculate tree depth
-            level = root.replace(project_dir, '').count(os.sep)
-            indent = '│&nbsp;&nbsp;&nbsp;' * (level - 1) + '├── ' if level > 0 else ''
+            if export_structure:
+                if progress_callback:
+                    progress_callback(0, "Building structure...")
+                
+                out.write("<h2>Project Structure</h2>\n")
+                out.write("<div class='structure'>\n")
+                out.write("<div class='tree'>\n")
             
-            # Write directory
-            dir_name = html.escape(os.path.basename(root))
-            html_content += f"<div>{indent}{dir_name}/</div>\n"
+            # Single pass: tree generation and text file collection
+            text_files = []
+            for root, level, dirs, files in _iter_tree(project_dir, exclude_dirs, exclude_files):
+                if export_content:
+                    text_files.extend(entry.path for entry in files if is_text_file(entry.name))
+                
+                if not export_structure:
+                    continue
+                
+                indent = '│&nbsp;&nbsp;&nbsp;' * (level - 1) + '├── ' if level > 0 else ''
+                
+                # Write directory
+                dir_name = escape(os.path.basename(root))
+                out.write(f"<div>{indent}{dir_name}/</div>\n")
+                
+                # Write files
+                file_indent = '│&nbsp;&nbsp;&nbsp;' * level + '├── '
+                last_file_indent = '│&nbsp;&nbsp;&nbsp;' * level + '└── '
+                for i, f in enumerate(files):
+                    prefix = last_file_indent if i == len(files) - 1 else file_indent
+                    file_name = escape(f.name)
+                    out.write(f"<div>{prefix}{file_name}</div>\n")
             
-            # Write files
-            file_indent = '│&nbsp;&nbsp;&nbsp;' * level + '├── '
-            last_file_indent = '│&nbsp;&nbsp;&nbsp;' * level + '└── '
-            for i, f in enumerate(files):
-                prefix = last_file_indent if i == len(files) - 1 else file_indent
-                file_name = html.escape(f)
-                html_content += f"<div>{prefix}{file_name}</div>\n"
-        
-        html_content += "</div>\n"  # .tree
-        html_content += "</div>\n"  # .structure
-    
-    # Export content
-    if mode in ["both", "content"]:
-        html_content += "<h2>File Contents</h2>\n"
-        
-        for root, dirs, files in os.walk(project_dir):
-            # Apply exclusions
-            dirs[:] = [d for d in dirs if d not in exclude_dirs]
-            files = [f for f in files if f not in exclude_files]
+            if export_structure:
+                out.write("</div>\n")  # .tree
+                out.write("</div>\n")  # .structure
             
-            for file in files:
-                file_path = os.path.join(root, file)
-                if not is_text_file(file_path):
-                    continue
+            total_files = len(text_files)
+            processed_files = 0
+            progress = 0
+            
+            # Export content
+            if export_content:
+                out.write("<h2>File Contents</h2>\n")
                 
-                try:
-                    # Read file content
-                    content = safe_read_file(file_path)
-                    rel_path = os.path.relpath(file_path, project_dir)
-                    
-                    # Add file section
-                    html_content += f"<div class='file-content'>\n"
-                    html_content += f"<div class='file-header'>{html.escape(rel_path)}</div>\n"
-                    html_content += f"<div class='content'>{html.escape(content)}</div>\n"
-                    html_content += "</div>\n"
-                    
-                    # Update progress
-                    processed_files += 1
-                    if progress_callback and total_files > 0:
-                        progress = int((processed_files / total_files) * 100)
-                        progress_callback(progress, f"Processed: {processed_files}/{total_files}")
-                except Exception as e:
-                    logging.error(f"Error processing file {file_path}: {e}")
-                    if progress_callback:
-                        progress_callback(progress, f"Error in file: {file_path}")
-    
-    # Close HTML document
-    html_content += "</body>\n</html>"
-    
-    # Write HTML output
-    try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(html_content)
+                for file_path, content in zip(text_files, _read_files(text_files)):
+                    try:
+                        # Add file section
+                        rel_path = file_path[prefix_len:]
+                        
+                        out.write(''.join([
+                            "<div class='file-content'>\n",
+                            f"<div class='file-header'>{escape(rel_path)}</div>\n",
+                            f"<div class='content'>{escape(content, quote=False)}</div>\n",
+                            "</div>\n"
+                        ]))
+                        
+                        # Update progress (redraw only when the percentage changes)
+                        processed_files += 1
+                        new_progress = processed_files * 100 // total_files
+                        if progress_callback and new_progress != progress:
+                            progress = new_progress
+                            progress_callback(progress, f"Processed: {processed_files}/{total_files}")
+                    except Exception as e:
+                        logging.error(f"Error processing file {file_path}: {e}")
+                        if progress_callback:
+                            progress_callback(progress, f"Error in file: {file_path}")
+            
+            # Close HTML document
+            out.write("</body>\n</html>")
         return True, ""
     except Exception as e:
         return False, str(e)
@@ -432,8 +552,9 @@ def export_project(project_dir, exclude_dirs, exclude_files, output_file, mode,
     else:
         return False, f"Unsupported format: {format}"
 
+@lru_cache(maxsize=None)
 def load_templates():
-    """Load built-in templates"""
+    """Load built-in templates (cached: treat the result as read-only)"""
     templates = {
         "Android": {
             "exclude_dirs": ["build", "gradle", ".gradle", ".idea", "captures"],
@@ -474,8 +595,8 @@ def interactive_mode():
     exclude_files = []
     if template_choice:
         template = templates[template_choice]
-        exclude_dirs = template.get("exclude_dirs", [])
-        exclude_files = template.get("exclude_files", [])
+        exclude_dirs = list(template.get("exclude_dirs", []))
+        exclude_files = list(template.get("exclude_files", []))
         print_success(f"Template applied: {template_choice}")
     
     # Directory input
@@ -599,8 +720,8 @@ def main():
             templates = load_templates()
             if args.template in templates:
                 template = templates[args.template]
-                exclude_dirs = template.get("exclude_dirs", [])
-                exclude_files = template.get("exclude_files", [])
+                exclude_dirs = list(template.get("exclude_dirs", []))
+                exclude_files = list(template.get("exclude_files", []))
             else:
                 print_error(f"Template {args.template} not found!")
                 return